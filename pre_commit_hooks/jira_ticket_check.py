@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
+import time
+from pathlib import Path
 from typing import Any
+from typing import TYPE_CHECKING
 
-import requests  # type: ignore [import-untyped]
+# The network modules are imported lazily so that commit messages which never reach
+# JIRA do not pay for loading them.
+if TYPE_CHECKING:
+    import http.client
+    import ssl
+    from urllib.parse import SplitResult
 
-JIRA_URL = os.getenv("JIRA_URL")
+JIRA_URL = os.getenv("JIRA_URL", "")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 JIRA_USERNAME = os.getenv("JIRA_USERNAME")
 CHANGE_REQUEST_REQUIRED = os.getenv("CHANGE_REQUEST_REQUIRED", "True").lower() in (
@@ -18,73 +27,418 @@ CHANGE_REQUEST_REQUIRED = os.getenv("CHANGE_REQUEST_REQUIRED", "True").lower() i
     "t",
 )
 
-if not JIRA_API_TOKEN or not JIRA_USERNAME:
-    print("JIRA_API_TOKEN and JIRA_USERNAME must be set as environment variables.")
-    print("Exiting with code 1")
-    sys.exit(1)
+# Matched against the raw commit message bytes; ticket IDs are always ASCII.
+_TICKET_RE = re.compile(rb"\b[A-Z]+-\d+\b")
+# Ticket IDs quoted in a JQL error, e.g. "An issue with key 'UTF-8' does not exist".
+_QUOTED_TICKET_RE = re.compile(r"'([A-Z][A-Z0-9_]*-\d+)'")
 
+# (connect, read) timeouts in seconds, so an unresponsive JIRA cannot hang the commit.
+JIRA_TIMEOUT = (3.05, 10)
+# Transient failures are retried with exponential backoff.
+JIRA_RETRIES = 3
+JIRA_BACKOFF_FACTOR = 0.5
+# Longest Retry-After, in seconds, the hook will wait for before giving up instead.
+JIRA_MAX_RETRY_AFTER = 10
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
 
-def get_commit_message() -> str:
+
+class JiraApiError(Exception):
+    """Raised when the JIRA API answers with an error response."""
+
+    def __init__(self, status: int, body: str) -> None:
+        super().__init__(f"Failed to connect to JIRA API: {status} {body}")
+        self.status = status
+        self.body = body
+
+
+def _get_proxy(url: SplitResult) -> SplitResult | None:
+    """
+    Looks up the proxy to use for a URL from the HTTP_PROXY, HTTPS_PROXY and NO_PROXY
+    environment variables (or the system settings where Python reads them).
+
+    Args:
+        url (SplitResult): The URL that will be requested.
+
+    Returns:
+        Optional[SplitResult]: The proxy URL, or None to connect directly.
+    """
+    from urllib.parse import urlsplit
+    from urllib.request import getproxies
+    from urllib.request import proxy_bypass
+
+    proxy = getproxies().get(url.scheme)
+    if not proxy or proxy_bypass(url.hostname or ""):
+        return None
+    return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _get_proxy_headers(proxy: SplitResult) -> dict[str, str]:
+    """
+    Builds the headers that authenticate with a proxy.
+
+    Args:
+        proxy (SplitResult): The proxy URL, optionally with credentials.
+
+    Returns:
+        Dict[str, str]: The Proxy-Authorization header, if the proxy has credentials.
+    """
+    from base64 import b64encode
+    from urllib.parse import unquote
+
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": f"Basic {b64encode(credentials.encode()).decode()}"}
+
+
+@functools.cache
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Creates the TLS context used for JIRA connections.
+
+    The CA bundle named by REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE is trusted if set,
+    otherwise certifi's bundle where it is installed, since some Python builds (such
+    as python.org's macOS installers) ship without a usable system trust store.
+
+    Returns:
+        ssl.SSLContext: The TLS context.
+    """
+    import ssl
+
+    cafile = os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE")
+    if not cafile:
+        try:
+            import certifi
+        except ImportError:
+            pass
+        else:
+            cafile = certifi.where()
+    return ssl.create_default_context(cafile=cafile)
+
+
+def _open_connection(url: SplitResult) -> http.client.HTTPConnection:
+    """
+    Creates a connection for a URL, going through a proxy where one is configured.
+
+    Args:
+        url (SplitResult): The URL that will be requested.
+
+    Returns:
+        http.client.HTTPConnection: The connection to the host or its proxy.
+    """
+    import http.client
+
+    connect_timeout, _ = JIRA_TIMEOUT
+    proxy = _get_proxy(url)
+    if proxy is None:
+        host, port = url.hostname or "", url.port
+    else:
+        host, port = proxy.hostname or "", proxy.port or 80
+
+    if url.scheme == "http":
+        return http.client.HTTPConnection(host, port, timeout=connect_timeout)
+    connection = http.client.HTTPSConnection(
+        host,
+        port,
+        timeout=connect_timeout,
+        context=_get_ssl_context(),
+    )
+    if proxy is not None:
+        # Tunnel through the proxy so TLS is still negotiated with JIRA itself.
+        connection.set_tunnel(
+            url.hostname or "",
+            url.port,
+            headers=_get_proxy_headers(proxy),
+        )
+    return connection
+
+
+@functools.cache
+def _get_connection() -> http.client.HTTPConnection:
+    """
+    Creates the connection shared by all JIRA requests, so they reuse the same
+    keep-alive connection and TLS session.
+
+    Returns:
+        http.client.HTTPConnection: The connection to the JIRA host.
+    """
+    from urllib.parse import urlsplit
+
+    return _open_connection(urlsplit(JIRA_URL))
+
+
+def _get_retry_after(header: str | None) -> float | None:
+    """
+    Parses a Retry-After header into the number of seconds to wait.
+
+    Args:
+        header (Optional[str]): The header value, in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if the header is absent or
+        invalid.
+    """
+    from email.utils import parsedate_to_datetime
+
+    if header is None:
+        return None
+    if header.strip().isdigit():
+        return float(header)
+    try:
+        retry_at = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def get_commit_message() -> bytes:
     """
     Reads the commit message from the file specified in the command-line arguments.
 
     Returns:
-        str: The content of the commit message.
+        bytes: The raw, undecoded content of the commit message.
     """
-    with open(sys.argv[1]) as file:
-        return file.read().strip()
+    return Path(sys.argv[1]).read_bytes()
 
 
-def jira_api_request(endpoint: str) -> Any:
+def _send_request(
+    connection: http.client.HTTPConnection,
+    url: SplitResult,
+    headers: dict[str, str],
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """
+    Sends a GET request, retrying transient failures with exponential backoff.
+
+    Args:
+        connection (http.client.HTTPConnection): The connection to send it on.
+        url (SplitResult): The URL to request.
+        headers (Dict[str, str]): The request headers.
+
+    Returns:
+        Tuple[http.client.HTTPResponse, bytes]: The final response and its body.
+
+    Raises:
+        OSError: If the host cannot be reached in time.
+        http.client.HTTPException: If the connection breaks mid-response.
+    """
+    import http.client
+
+    target = f"{url.path or '/'}?{url.query}" if url.query else url.path or "/"
+    proxy = _get_proxy(url) if url.scheme == "http" else None
+    if proxy is not None:
+        # Plain HTTP proxies expect the absolute URL in the request line.
+        target = url.geturl()
+        headers = {**headers, **_get_proxy_headers(proxy)}
+
+    # Permanent failures such as DNS or certificate errors are not worth retrying.
+    retryable_errors = (ConnectionError, TimeoutError, http.client.BadStatusLine)
+    _, read_timeout = JIRA_TIMEOUT
+
+    attempt = 0
+    while True:
+        delay = None
+        try:
+            if connection.sock is None:
+                connection.connect()
+            # Connect with the short timeout, then allow longer for the response.
+            connection.sock.settimeout(read_timeout)
+            connection.request("GET", target, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            # Drop the broken connection; the next request reconnects.
+            connection.close()
+            if attempt == JIRA_RETRIES or not isinstance(e, retryable_errors):
+                raise
+        else:
+            if attempt == JIRA_RETRIES or response.status not in _RETRY_STATUSES:
+                return response, body
+            delay = _get_retry_after(response.getheader("Retry-After"))
+            if delay is not None and delay > JIRA_MAX_RETRY_AFTER:
+                return response, body
+        if delay is None:
+            delay = JIRA_BACKOFF_FACTOR * 2**attempt
+        time.sleep(delay)
+        attempt += 1
+
+
+def jira_api_request(endpoint: str, params: dict[str, Any] | None = None) -> Any:
     """
     Makes a GET request to the JIRA API to retrieve data for a given endpoint.
 
     Args:
         endpoint (str): The JIRA API endpoint to query.
+        params (Optional[Dict[str, Any]]): Query string parameters for the request.
 
     Returns:
         Dict[str, Any]: The JSON response from the JIRA API as a dictionary.
 
+    Raises:
+        OSError: If JIRA cannot be reached in time.
+        http.client.HTTPException: If the connection to JIRA breaks mid-response.
+        JiraApiError: If the JIRA API returns an error response.
+    """
+    from base64 import b64encode
+    from urllib.parse import urlencode
+    from urllib.parse import urljoin
+    from urllib.parse import urlsplit
+
+    import orjson
+
+    url = urlsplit(f"{JIRA_URL.rstrip('/')}/rest/api/2/{endpoint}")
+    if params:
+        url = url._replace(query=urlencode(params))
+    credentials = b64encode(f"{JIRA_USERNAME}:{JIRA_API_TOKEN}".encode()).decode()
+    headers = {
+        "Authorization": f"Basic {credentials}",
+        "Accept": "application/json",
+    }
+
+    response, body = _send_request(_get_connection(), url, headers)
+
+    # Follow a single redirect, e.g. from http:// to https:// or to a moved base URL.
+    location = response.getheader("Location")
+    if response.status in _REDIRECT_STATUSES and location:
+        redirect = urlsplit(urljoin(url.geturl(), location))
+        if redirect.hostname != url.hostname:
+            # Like requests, do not hand the credentials to a different host.
+            del headers["Authorization"]
+        if (redirect.scheme, redirect.netloc) == (url.scheme, url.netloc):
+            response, body = _send_request(_get_connection(), redirect, headers)
+        else:
+            connection = _open_connection(redirect)
+            try:
+                response, body = _send_request(connection, redirect, headers)
+            finally:
+                connection.close()
+
+    if response.status != 200:
+        raise JiraApiError(response.status, body.decode("utf-8", "replace"))
+    return orjson.loads(body)
+
+
+def get_jira_ticket_status(ticket_id: str) -> str | None:
+    """
+    Retrieves the status of a single JIRA ticket.
+
+    Args:
+        ticket_id (str): The JIRA ticket ID to look up.
+
+    Returns:
+        Optional[str]: The status name, or None if the ticket does not exist.
+
     Raises:
         Exception: If the request to the JIRA API fails.
     """
-    url = f"{JIRA_URL}/rest/api/2/{endpoint}"
-    response = requests.get(url, auth=(JIRA_USERNAME, JIRA_API_TOKEN))
-    if response.status_code != 200:
-        raise Exception(
-            f"Failed to connect to JIRA API: {response.status_code} {response.text}",
-        )
-    return response.json()
+    try:
+        issue = jira_api_request(f"issue/{ticket_id}", params={"fields": "status"})
+    except JiraApiError as e:
+        if e.status == 404:
+            return None
+        raise
+    status_name: str = issue["fields"]["status"]["name"]
+    return status_name
 
 
-def validate_jira_ticket(ticket_id: str, valid_statuses: list[str]) -> bool:
+def get_jira_ticket_statuses(ticket_ids: list[str]) -> dict[str, str]:
+    """
+    Retrieves the status of every given JIRA ticket, using a single search request
+    where possible.
+
+    Args:
+        ticket_ids (List[str]): The JIRA ticket IDs to look up.
+
+    Returns:
+        Dict[str, str]: A mapping of ticket ID to status name. Tickets that do not
+        exist are absent from the mapping, as are any tickets after the first
+        missing one that the search did not return.
+
+    Raises:
+        Exception: If the request to the JIRA API fails.
+    """
+    statuses: dict[str, str] = {}
+    not_found: set[str] = set()
+    remaining = ticket_ids
+    # search/jql only exists on Jira Cloud; Jira Server/Data Center only has search.
+    endpoints = ["search/jql", "search"]
+    while remaining and endpoints:
+        try:
+            response = jira_api_request(
+                endpoints[0],
+                params={
+                    "jql": f"key in ({','.join(remaining)})",
+                    "fields": "status",
+                    "maxResults": len(remaining),
+                },
+            )
+        except JiraApiError as e:
+            if e.status in (404, 405):
+                endpoints.pop(0)
+                continue
+            if e.status != 400:
+                raise
+            # The search rejects the whole query when any of the keys does not exist,
+            # naming those keys in the error. Drop them and search for the rest.
+            unknown = set(_QUOTED_TICKET_RE.findall(e.body)) & set(remaining)
+            if not unknown:
+                break
+            not_found |= unknown
+            remaining = [ticket for ticket in remaining if ticket not in unknown]
+            continue
+        statuses = {
+            issue["key"]: issue["fields"]["status"]["name"]
+            for issue in response["issues"]
+            if issue["key"] in remaining
+        }
+        break
+
+    # Moved tickets come back under their new key, and the server may cap the page
+    # below maxResults, so look up anything the search did not return one by one.
+    # The hook fails on the first missing ticket, so stop there.
+    for ticket_id in ticket_ids:
+        if ticket_id in statuses:
+            continue
+        if ticket_id in not_found:
+            break
+        status_name = get_jira_ticket_status(ticket_id)
+        if status_name is None:
+            break
+        statuses[ticket_id] = status_name
+    return statuses
+
+
+def validate_jira_ticket(
+    ticket_id: str,
+    status_name: str | None,
+    valid_statuses: list[str],
+) -> bool:
     """
     Validates a JIRA ticket by checking if it exists and is in one of the valid statuses.
 
     Args:
         ticket_id (str): The JIRA ticket ID to validate.
+        status_name (Optional[str]): The current status of the ticket, or None if the
+            ticket was not found.
         valid_statuses (List[str]): A list of valid statuses.
 
     Returns:
         bool: True if the ticket is valid and in one of the valid statuses, False otherwise.
     """
-    try:
-        issue = jira_api_request(f"issue/{ticket_id}")
-        status_name = issue["fields"]["status"]["name"]
-        if ticket_id.startswith("CR-"):
-            if status_name != "Approved":
-                print(f"CR ticket {ticket_id} is not in the 'Approved' status.")
-                return False
-        else:
-            if status_name not in valid_statuses:
-                print(
-                    f"Ticket {ticket_id} is not in one of the valid statuses: {valid_statuses}",
-                )
-                return False
-        return True
-    except Exception as e:
-        print(f"Failed to validate JIRA ticket {ticket_id}: {e}")
+    if status_name is None:
+        print(f"Ticket {ticket_id} was not found in JIRA.")
         return False
+    if ticket_id.startswith("CR-"):
+        if status_name != "Approved":
+            print(f"CR ticket {ticket_id} is not in the 'Approved' status.")
+            return False
+    else:
+        if status_name not in valid_statuses:
+            print(
+                f"Ticket {ticket_id} is not in one of the valid statuses: {valid_statuses}",
+            )
+            return False
+    return True
 
 
 def main() -> None:
@@ -95,6 +449,13 @@ def main() -> None:
     if applicable. Exits with status 0 if all checks pass, otherwise exits with status 1.
     """
 
+    if not JIRA_URL or not JIRA_API_TOKEN or not JIRA_USERNAME:
+        print(
+            "JIRA_URL, JIRA_API_TOKEN and JIRA_USERNAME must be set as environment variables.",
+        )
+        print("Exiting with code 1")
+        sys.exit(1)
+
     parser = argparse.ArgumentParser(description="Check JIRA ticket requirements.")
     parser.add_argument(
         "--change-request-required",
@@ -105,13 +466,15 @@ def main() -> None:
 
     change_request_required = args.change_request_required or CHANGE_REQUEST_REQUIRED
 
-    # Your existing logic here, using the change_request_required variable as needed
     print(f"Change request required: {change_request_required}")
 
     commit_message = get_commit_message()
 
-    ticket_regex = re.compile(r"\b[A-Z]+-\d+\b")
-    tickets = ticket_regex.findall(commit_message)
+    # Look up each ticket once, and decode only the matched IDs, not the whole message.
+    tickets = [
+        ticket.decode("ascii")
+        for ticket in dict.fromkeys(_TICKET_RE.findall(commit_message))
+    ]
 
     if not tickets:
         print("No JIRA ticket found in commit message.")
@@ -119,8 +482,13 @@ def main() -> None:
         sys.exit(1)
 
     valid_statuses = ["In Progress"]
-    cr_ticket_found = False
 
+    cr_tickets: list[str] = []
+    other_tickets: list[str] = []
+    for ticket in tickets:
+        (cr_tickets if ticket.startswith("CR-") else other_tickets).append(ticket)
+
+    # Both requirements can be checked locally, so fail before contacting JIRA.
     if change_request_required:
         if len(tickets) < 2:
             print(
@@ -128,24 +496,34 @@ def main() -> None:
             )
             sys.exit(1)
 
-        for ticket in tickets:
-            if ticket.startswith("CR-"):
-                cr_ticket_found = True
-                if not validate_jira_ticket(ticket, ["Approved"]):
-                    sys.exit(1)
-            else:
-                if not validate_jira_ticket(ticket, valid_statuses):
-                    sys.exit(1)
-
-        if not cr_ticket_found:
+        if not cr_tickets:
             print(
                 "Change request ticket (CR-) is required but not found in commit message.",
             )
             sys.exit(1)
-    else:
-        for ticket in tickets:
-            if not validate_jira_ticket(ticket, valid_statuses):
-                sys.exit(1)
+
+    import http.client
+
+    try:
+        statuses = get_jira_ticket_statuses(tickets)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"JIRA is unreachable at {JIRA_URL}: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Failed to retrieve JIRA tickets {', '.join(tickets)}: {e}")
+        sys.exit(1)
+
+    # Stop at the first failure in commit message order; tickets after a missing one
+    # may not have been looked up.
+    if not all(
+        validate_jira_ticket(
+            ticket,
+            statuses.get(ticket),
+            ["Approved"] if ticket in cr_tickets else valid_statuses,
+        )
+        for ticket in tickets
+    ):
+        sys.exit(1)
 
     print("JIRA ticket(s) validated successfully.")
     print("Exiting with code 0")